@@ -1,7 +1,11 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
     training_type: str
@@ -9,24 +13,39 @@ class InfoMessage:
     distance: float
     speed: float
     calories: float
-    TEXT = (
-        'Тип тренировки: {}; '
-        'Длительность: {:.3f} ч.; '
-        'Дистанция: {:.3f} км; '
-        'Ср. скорость: {:.3f} км/ч; '
-        'Потрачено ккал: {:.3f}.'
-    )
+    _message: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_message',
+                           f'Тип тренировки: {self.training_type}; '
+                           f'Длительность: {self.duration:.3f} ч.; '
+                           f'Дистанция: {self.distance:.3f} км; '
+                           f'Ср. скорость: {self.speed:.3f} км/ч; '
+                           f'Потрачено ккал: {self.calories:.3f}.')
+
+    def __str__(self) -> str:
+        return self._message
 
     def get_message(self) -> str:
         """"Получить информацию о тренировке."""
-        return self.TEXT.format(*asdict(self).values())
+        return self._message
 
 
 class Training:
     """Базовый класс тренировки."""
+    TRAINING_TYPE: ClassVar[str] = 'Training'
     M_IN_KM: float = 1000  # Из метров в километры.
     H_IN_MIN: float = 60  # Из часов в минуты.
+    MIN_PER_KM_FACTOR: float = H_IN_MIN / M_IN_KM  # Часы в минуты, м в км.
     LEN_STEP: float = 0.65  # Длина шага в метрах.
+    # Скомпилированный класс из kernels и аргументы для его создания.
+    JIT_CLASS: ClassVar[str] = ''
+    JIT_ARGS: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Задать тип тренировки по имени подкласса."""
+        super().__init_subclass__(**kwargs)
+        cls.TRAINING_TYPE = cls.__name__
 
     def __init__(self,
                  action: int,
@@ -44,40 +63,54 @@ class Training:
         """Получить среднюю скорость движения в км/ч."""
         return self.get_distance() / self.duration
 
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(self, mean_speed: float | None = None) -> float:
         """Получить количество затраченных калорий."""
         raise NotImplementedError(
             'Определите get_spent_calories в %s.' % (type(self). __name__)
         )
 
+    def to_jit(self):
+        """Получить скомпилированную копию тренировки."""
+        import kernels
+
+        if not self.JIT_CLASS:
+            raise NotImplementedError(
+                'Определите JIT_CLASS в %s.' % (type(self).__name__)
+            )
+        return getattr(kernels, self.JIT_CLASS)(
+            *(getattr(self, name) for name in self.JIT_ARGS)
+        )
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(type(self). __name__,
+        distance = self.get_distance()
+        speed = self.get_mean_speed()
+        return InfoMessage(self.TRAINING_TYPE,
                            self.duration,
-                           self.get_distance(),
-                           self.get_mean_speed(),
-                           self.get_spent_calories())
+                           distance,
+                           speed,
+                           self.get_spent_calories(speed))
 
 
 class Running(Training):
     """Тренировка: бег."""
     CALORIES_MEAN_SPEED_MULTIPLIER: int = 18
     CALORIES_MEAN_SPEED_SHIFT: float = 1.79
+    JIT_CLASS: ClassVar[str] = 'RunningJC'
+    JIT_ARGS: ClassVar[tuple[str, ...]] = (
+        'action', 'duration', 'weight', 'LEN_STEP', 'M_IN_KM',
+        'CALORIES_MEAN_SPEED_MULTIPLIER', 'CALORIES_MEAN_SPEED_SHIFT',
+        'MIN_PER_KM_FACTOR',
+    )
 
-    def __init__(self, action: int,
-                 duration: float,
-                 weight: float) -> None:
-        super().__init__(action,
-                         duration,
-                         weight)
-
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(self, mean_speed: float | None = None) -> float:
         """Получить количество затраченных калорий при беге."""
+        if mean_speed is None:
+            mean_speed = self.get_mean_speed()
         return ((self.CALORIES_MEAN_SPEED_MULTIPLIER
-                 * self.get_mean_speed()
+                 * mean_speed
                  + self.CALORIES_MEAN_SPEED_SHIFT)
-                * self.weight / self.M_IN_KM
-                * (self.duration * self.H_IN_MIN))
+                * self.weight * self.duration * self.MIN_PER_KM_FACTOR)
 
 
 class SportsWalking(Training):
@@ -86,6 +119,13 @@ class SportsWalking(Training):
     COEF_2: float = 0.029  # Классовый коэфицент.
     KM_H_IN_M_S: float = 0.278  # Из км/ч в м/с.
     CM_IN_M: float = 100  # Из сантиметров в метры.
+    # Квадрат перевода км/ч в м/с, умноженный на перевод см в м.
+    SPEED_HEIGHT_FACTOR: float = KM_H_IN_M_S ** 2 * CM_IN_M
+    JIT_CLASS: ClassVar[str] = 'WalkingJC'
+    JIT_ARGS: ClassVar[tuple[str, ...]] = (
+        'action', 'duration', 'weight', 'height', 'LEN_STEP', 'M_IN_KM',
+        'COEF_1', 'COEF_2', 'SPEED_HEIGHT_FACTOR', 'H_IN_MIN',
+    )
 
     def __init__(self,
                  action: int,
@@ -97,13 +137,15 @@ class SportsWalking(Training):
                          weight)
         self.height = height
 
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(self, mean_speed: float | None = None) -> float:
         """Получить количество затраченных калорий при ходьбе."""
-        return ((self.COEF_1 * self.weight
-                 + ((self.get_mean_speed() * self.KM_H_IN_M_S)**2
-                    / (self.height / self.CM_IN_M))
-                 * self.COEF_2 * self.weight)
-                * (self.duration * self.H_IN_MIN))
+        if mean_speed is None:
+            mean_speed = self.get_mean_speed()
+        return ((self.COEF_1
+                 + mean_speed * mean_speed
+                 * self.SPEED_HEIGHT_FACTOR / self.height
+                 * self.COEF_2)
+                * self.weight * self.duration * self.H_IN_MIN)
 
 
 class Swimming(Training):
@@ -111,6 +153,11 @@ class Swimming(Training):
     LEN_STEP: float = 1.38  # Длина одного гребка в м.
     NUMBER_1: float = 1.1  # Классовый коэфицент.
     NUMBER_2: float = 2  # Классовый коэфицент.
+    JIT_CLASS: ClassVar[str] = 'SwimmingJC'
+    JIT_ARGS: ClassVar[tuple[str, ...]] = (
+        'action', 'duration', 'weight', 'length_pool', 'count_pool',
+        'LEN_STEP', 'M_IN_KM', 'NUMBER_1', 'NUMBER_2',
+    )
 
     def __init__(self,
                  action: int,
@@ -124,9 +171,11 @@ class Swimming(Training):
         self.length_pool = length_pool
         self.count_pool = count_pool
 
-    def get_spent_calories(self):
+    def get_spent_calories(self, mean_speed: float | None = None) -> float:
         """Получить количество затраченных калорий при плавании."""
-        return ((self.get_mean_speed() + self.NUMBER_1)
+        if mean_speed is None:
+            mean_speed = self.get_mean_speed()
+        return ((mean_speed + self.NUMBER_1)
                 * self.NUMBER_2 * self.weight * self.duration)
 
     def get_mean_speed(self):
@@ -135,19 +184,27 @@ class Swimming(Training):
                 / self.M_IN_KM / self.duration)
 
 
+_UNKNOWN_MSG = ('Данный тип тренировки неизвестен. '
+                'Попробуйте походить, поплавать или бег.')
+
+WORKOUT_CODE: dict[str, type[Training]] = {
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking
+}
+
+
 def read_package(workout_type: str, data: list[int]) -> Training:
     """Прочитать данные полученные от датчиков."""
     # Создает экземпляр класса Traning.
-    workout_code: dict[str, type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
-    }
-    if workout_type in workout_code:
-        return workout_code[workout_type](*data)
-    else:
-        print('Данный тип тренировки неизвестен. '
-              'Попробуйте походить, поплавать или бег.')
+    if workout_type not in WORKOUT_CODE:
+        raise ValueError(_UNKNOWN_MSG)
+    return WORKOUT_CODE[workout_type](*data)
+
+
+def read_package_jit(workout_type: str, data: list[int]):
+    """Прочитать данные датчиков в скомпилированный класс тренировки."""
+    return read_package(workout_type, data).to_jit()
 
 
 def main(training: Training) -> None:
@@ -156,6 +213,81 @@ def main(training: Training) -> None:
     print(info.get_message())
 
 
+def _columns(records: 'np.ndarray', width: int) -> 'np.ndarray':
+    """Разложить массив записей датчиков на столбцы."""
+    import numpy as np
+
+    array = np.asarray(records, dtype=np.float64)
+    if array.size == 0:
+        array = array.reshape(0, width)
+    if array.ndim != 2 or array.shape[1] != width:
+        raise ValueError(
+            f'Ожидались записи длины {width}, '
+            f'получен массив формы {array.shape}.'
+        )
+    # Длительность — второй показатель у всех видов тренировок.
+    if (array[:, 1] <= 0).any():
+        raise ValueError('Длительность тренировки должна быть больше нуля.')
+    return array.T
+
+
+def _batch_messages(training_type: str,
+                    duration: 'np.ndarray',
+                    distance: 'np.ndarray',
+                    speed: 'np.ndarray',
+                    calories: 'np.ndarray') -> list[str]:
+    """Получить сообщения для пакета тренировок одного типа."""
+    return [InfoMessage(training_type, *row).get_message()
+            for row in zip(duration.tolist(),
+                           distance.tolist(),
+                           speed.tolist(),
+                           calories.tolist())]
+
+
+def main_batch(run_arr: 'np.ndarray',
+               walk_arr: 'np.ndarray',
+               swim_arr: 'np.ndarray') -> None:
+    """Обработать пакеты тренировок целиком, по массиву на вид спорта."""
+    import kernels
+
+    # Бег: action, duration, weight.
+    action, duration, weight = _columns(run_arr, 3)
+    distance = kernels.distance(action, Running.LEN_STEP, Running.M_IN_KM)
+    speed = distance / duration
+    calories = kernels.run_cal_array(speed, duration, weight,
+                                     Running.CALORIES_MEAN_SPEED_MULTIPLIER,
+                                     Running.CALORIES_MEAN_SPEED_SHIFT,
+                                     Running.MIN_PER_KM_FACTOR)
+    messages = _batch_messages(Running.TRAINING_TYPE,
+                               duration, distance, speed, calories)
+
+    # Спортивная ходьба: action, duration, weight, height.
+    action, duration, weight, height = _columns(walk_arr, 4)
+    distance = kernels.distance(action, SportsWalking.LEN_STEP,
+                                SportsWalking.M_IN_KM)
+    speed = distance / duration
+    calories = kernels.walk_cal_array(speed, duration, weight, height,
+                                      SportsWalking.COEF_1,
+                                      SportsWalking.COEF_2,
+                                      SportsWalking.SPEED_HEIGHT_FACTOR,
+                                      SportsWalking.H_IN_MIN)
+    messages += _batch_messages(SportsWalking.TRAINING_TYPE,
+                                duration, distance, speed, calories)
+
+    # Плавание: action, duration, weight, length_pool, count_pool.
+    action, duration, weight, length_pool, count_pool = _columns(swim_arr, 5)
+    distance = kernels.distance(action, Swimming.LEN_STEP, Swimming.M_IN_KM)
+    speed = kernels.pool_speed(length_pool, count_pool, duration,
+                               Swimming.M_IN_KM)
+    calories = kernels.swim_cal_array(speed, duration, weight,
+                                      Swimming.NUMBER_1, Swimming.NUMBER_2)
+    messages += _batch_messages(Swimming.TRAINING_TYPE,
+                                duration, distance, speed, calories)
+
+    for message in messages:
+        print(message)
+
+
 if __name__ == '__main__':
     packages = [
         ('SWM', [720, 1, 80, 25, 40]),
@@ -0,0 +1,187 @@
+from numba import float64, njit, vectorize
+from numba.experimental import jitclass
+
+
+@njit(cache=True)
+def distance(action, len_step, m_in_km):
+    """Дистанция в км по числу шагов или гребков."""
+    return action * len_step / m_in_km
+
+
+@njit(cache=True)
+def mean_speed(action, duration, len_step, m_in_km):
+    """Средняя скорость в км/ч по числу шагов."""
+    return distance(action, len_step, m_in_km) / duration
+
+
+@njit(cache=True)
+def pool_speed(length_pool, count_pool, duration, m_in_km):
+    """Средняя скорость плавания в км/ч по длине и числу бассейнов."""
+    return length_pool * count_pool / m_in_km / duration
+
+
+@njit(cache=True)
+def run_cal(speed, duration, weight, multiplier, shift, min_per_km_factor):
+    """Калории, затраченные на бег."""
+    return ((multiplier * speed + shift)
+            * weight * duration * min_per_km_factor)
+
+
+@njit(cache=True)
+def walk_cal(speed, duration, weight, height,
+             coef_1, coef_2, speed_height_factor, h_in_min):
+    """Калории, затраченные на спортивную ходьбу."""
+    return ((coef_1 + speed * speed * speed_height_factor / height * coef_2)
+            * weight * duration * h_in_min)
+
+
+@njit(cache=True)
+def swim_cal(speed, duration, weight, coef_1, coef_2):
+    """Калории, затраченные на плавание."""
+    return (speed + coef_1) * coef_2 * weight * duration
+
+
+@vectorize([float64(float64, float64, float64,
+                    float64, float64, float64)],
+           target='parallel', cache=True)
+def run_cal_array(speed, duration, weight,
+                  multiplier, shift, min_per_km_factor):
+    """Калории, затраченные на бег, для массивов тренировок."""
+    return run_cal(speed, duration, weight,
+                   multiplier, shift, min_per_km_factor)
+
+
+@vectorize([float64(float64, float64, float64, float64,
+                    float64, float64, float64, float64)],
+           target='parallel', cache=True)
+def walk_cal_array(speed, duration, weight, height,
+                   coef_1, coef_2, speed_height_factor, h_in_min):
+    """Калории, затраченные на ходьбу, для массивов тренировок."""
+    return walk_cal(speed, duration, weight, height,
+                    coef_1, coef_2, speed_height_factor, h_in_min)
+
+
+@vectorize([float64(float64, float64, float64, float64, float64)],
+           target='parallel', cache=True)
+def swim_cal_array(speed, duration, weight, coef_1, coef_2):
+    """Калории, затраченные на плавание, для массивов тренировок."""
+    return swim_cal(speed, duration, weight, coef_1, coef_2)
+
+
+@jitclass([('action', float64),
+           ('duration', float64),
+           ('weight', float64),
+           ('len_step', float64),
+           ('m_in_km', float64),
+           ('multiplier', float64),
+           ('shift', float64),
+           ('min_per_km_factor', float64)])
+class RunningJC:
+    """Скомпилированная тренировка: бег."""
+
+    def __init__(self, action, duration, weight,
+                 len_step, m_in_km, multiplier, shift, min_per_km_factor):
+        self.action = action
+        self.duration = duration
+        self.weight = weight
+        self.len_step = len_step
+        self.m_in_km = m_in_km
+        self.multiplier = multiplier
+        self.shift = shift
+        self.min_per_km_factor = min_per_km_factor
+
+    def get_distance(self):
+        """Получить дистанцию в км."""
+        return distance(self.action, self.len_step, self.m_in_km)
+
+    def get_mean_speed(self):
+        """Получить среднюю скорость движения в км/ч."""
+        return mean_speed(self.action, self.duration,
+                          self.len_step, self.m_in_km)
+
+    def get_spent_calories(self):
+        """Получить количество затраченных калорий при беге."""
+        return run_cal(self.get_mean_speed(), self.duration, self.weight,
+                       self.multiplier, self.shift, self.min_per_km_factor)
+
+
+@jitclass([('action', float64),
+           ('duration', float64),
+           ('weight', float64),
+           ('height', float64),
+           ('len_step', float64),
+           ('m_in_km', float64),
+           ('coef_1', float64),
+           ('coef_2', float64),
+           ('speed_height_factor', float64),
+           ('h_in_min', float64)])
+class WalkingJC:
+    """Скомпилированная тренировка: спортивная ходьба."""
+
+    def __init__(self, action, duration, weight, height,
+                 len_step, m_in_km, coef_1, coef_2,
+                 speed_height_factor, h_in_min):
+        self.action = action
+        self.duration = duration
+        self.weight = weight
+        self.height = height
+        self.len_step = len_step
+        self.m_in_km = m_in_km
+        self.coef_1 = coef_1
+        self.coef_2 = coef_2
+        self.speed_height_factor = speed_height_factor
+        self.h_in_min = h_in_min
+
+    def get_distance(self):
+        """Получить дистанцию в км."""
+        return distance(self.action, self.len_step, self.m_in_km)
+
+    def get_mean_speed(self):
+        """Получить среднюю скорость движения в км/ч."""
+        return mean_speed(self.action, self.duration,
+                          self.len_step, self.m_in_km)
+
+    def get_spent_calories(self):
+        """Получить количество затраченных калорий при ходьбе."""
+        return walk_cal(self.get_mean_speed(), self.duration, self.weight,
+                        self.height, self.coef_1, self.coef_2,
+                        self.speed_height_factor, self.h_in_min)
+
+
+@jitclass([('action', float64),
+           ('duration', float64),
+           ('weight', float64),
+           ('length_pool', float64),
+           ('count_pool', float64),
+           ('len_step', float64),
+           ('m_in_km', float64),
+           ('coef_1', float64),
+           ('coef_2', float64)])
+class SwimmingJC:
+    """Скомпилированная тренировка: плавание."""
+
+    def __init__(self, action, duration, weight, length_pool, count_pool,
+                 len_step, m_in_km, coef_1, coef_2):
+        self.action = action
+        self.duration = duration
+        self.weight = weight
+        self.length_pool = length_pool
+        self.count_pool = count_pool
+        self.len_step = len_step
+        self.m_in_km = m_in_km
+        self.coef_1 = coef_1
+        self.coef_2 = coef_2
+
+    def get_distance(self):
+        """Получить дистанцию в км."""
+        return distance(self.action, self.len_step, self.m_in_km)
+
+    def get_mean_speed(self):
+        """Получить среднюю скорость движения при плавании в км/ч."""
+        return pool_speed(self.length_pool, self.count_pool,
+                          self.duration, self.m_in_km)
+
+    def get_spent_calories(self):
+        """Получить количество затраченных калорий при плавании."""
+        return swim_cal(self.get_mean_speed(), self.duration, self.weight,
+                        self.coef_1, self.coef_2)
@@ -1,7 +1,12 @@
-from dataclasses import dataclass
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import FunctionType
+from typing import ClassVar
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
@@ -10,23 +15,56 @@ class InfoMessage:
     distance: float
     speed: float
     calories: float
+    _message: str = field(init=False, repr=False, compare=False)
 
-    def __str__(self) -> str:
-        return (
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_message', (
             f'Тип тренировки: {self.training_type}; '
             f'Длительность: {self.duration:.3f} ч.; '
             f'Дистанция: {self.distance:.3f} км; '
             f'Ср. скорость: {self.speed:.3f} км/ч; '
             f'Потрачено ккал: {self.calories:.3f}.'
-        )
+        ))
+
+    def __str__(self) -> str:
+        return self._message
 
 
-class Training:
+class Training(ABC):
     """Базовый класс тренировки."""
+
+    __slots__ = ('action', 'duration', 'weight')
+
+    TRAINING_TYPE: ClassVar[str] = 'Training'
     M_IN_KM: float = 1000
     H_IN_MIN: float = 60
+    MIN_PER_KM_FACTOR: float = H_IN_MIN / M_IN_KM
     len_step: float = 0.65
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Задать тип тренировки и константы подкласса в get_spent_calories.
+
+        Константы передаются в get_spent_calories именованными аргументами
+        по умолчанию; унаследованный метод получает значения подкласса.
+        """
+
+        super().__init_subclass__(**kwargs)
+        cls.TRAINING_TYPE = cls.__name__
+        method = cls.get_spent_calories
+        if 'get_spent_calories' in vars(cls) or not method.__kwdefaults__:
+            return
+        constants = {name: getattr(cls, name, value)
+                     for name, value in method.__kwdefaults__.items()}
+        if constants == method.__kwdefaults__:
+            return
+        rebound = FunctionType(method.__code__, method.__globals__,
+                               method.__name__, method.__defaults__,
+                               method.__closure__)
+        rebound.__kwdefaults__ = constants
+        rebound.__doc__ = method.__doc__
+        rebound.__qualname__ = f'{cls.__qualname__}.get_spent_calories'
+        cls.get_spent_calories = rebound
+
     def __init__(self, action: int, duration: float, weight: float) -> None:
         self.action = action
         self.duration = duration
@@ -42,49 +80,61 @@ class Training:
 
         return self.get_distance() / self.duration
 
-    def get_spent_calories(self) -> float:
+    @abstractmethod
+    def get_spent_calories(self, mean_speed: float | None = None) -> float:
         """Получить количество затраченных калорий."""
 
-        raise NotImplementedError(
-            f'Определите get_spent_calories в {type(self).__name__}.'
-        )
+        raise NotImplementedError
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
 
-        return InfoMessage(type(self).__name__,
+        speed = self.get_mean_speed()
+        return InfoMessage(self.TRAINING_TYPE,
                            self.duration,
                            self.get_distance(),
-                           self.get_mean_speed(),
-                           self.get_spent_calories())
+                           speed,
+                           self.get_spent_calories(speed))
 
 
 class Running(Training):
     """Тренировка: бег."""
 
+    __slots__ = ()
+
     CALORIES_MEAN_SPEED_MULTIPLIER: int = 18
     CALORIES_MEAN_SPEED_SHIFT: float = 1.79
 
-    def __init__(self, action: int, duration: float, weight: float) -> None:
-        super().__init__(action, duration, weight)
-
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(
+            self,
+            mean_speed: float | None = None,
+            *,
+            CALORIES_MEAN_SPEED_MULTIPLIER: float = (
+                CALORIES_MEAN_SPEED_MULTIPLIER),
+            CALORIES_MEAN_SPEED_SHIFT: float = CALORIES_MEAN_SPEED_SHIFT,
+            MIN_PER_KM_FACTOR: float = Training.MIN_PER_KM_FACTOR
+    ) -> float:
         """Получить количество затраченных калорий при беге."""
 
+        if mean_speed is None:
+            mean_speed = self.get_mean_speed()
         return (
-            (self.CALORIES_MEAN_SPEED_MULTIPLIER * self.get_mean_speed() +
-             self.CALORIES_MEAN_SPEED_SHIFT) * self.weight / self.M_IN_KM *
-            (self.duration * self.H_IN_MIN)
+            (CALORIES_MEAN_SPEED_MULTIPLIER * mean_speed +
+             CALORIES_MEAN_SPEED_SHIFT) *
+            self.weight * self.duration * MIN_PER_KM_FACTOR
         )
 
 
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
 
+    __slots__ = ('height',)
+
     COEF_1: float = 0.035
     COEF_2: float = 0.029
     KM_H_IN_M_S: float = 0.278
     CM_IN_M: float = 100
+    SPEED_HEIGHT_FACTOR: float = KM_H_IN_M_S ** 2 * CM_IN_M
 
     def __init__(self,
                  action: int,
@@ -94,19 +144,31 @@ class SportsWalking(Training):
         super().__init__(action, duration, weight)
         self.height = height
 
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(
+            self,
+            mean_speed: float | None = None,
+            *,
+            COEF_1: float = COEF_1,
+            COEF_2: float = COEF_2,
+            SPEED_HEIGHT_FACTOR: float = SPEED_HEIGHT_FACTOR,
+            H_IN_MIN: float = Training.H_IN_MIN
+    ) -> float:
         """Получить количество затраченных калорий при ходьбе."""
 
+        if mean_speed is None:
+            mean_speed = self.get_mean_speed()
         return (
-            (self.COEF_1 * self.weight + (
-                (self.get_mean_speed() * self.KM_H_IN_M_S) ** 2 /
-                (self.height / self.CM_IN_M)
-            ) * self.COEF_2 * self.weight) * (self.duration * self.H_IN_MIN))
+            (COEF_1 +
+             mean_speed * mean_speed * SPEED_HEIGHT_FACTOR / self.height *
+             COEF_2) * self.weight * self.duration * H_IN_MIN
+        )
 
 
 class Swimming(Training):
     """Тренировка: плавание."""
 
+    __slots__ = ('length_pool', 'count_pool')
+
     COEF_1: float = 1.1
     COEF_2: float = 2
     len_step: float = 1.38
@@ -121,43 +183,79 @@ class Swimming(Training):
         self.length_pool = length_pool
         self.count_pool = count_pool
 
-    def get_spent_calories(self):
-        """Получить количество затраченных калорий при плавании."""
-
-        return (
-            (self.get_mean_speed() + self.COEF_1) *
-            self.COEF_2 * self.weight * self.duration
-            )
-
-    def get_mean_speed(self):
+    def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения при плавании в км/ч."""
 
         return (
             self.length_pool * self.count_pool / self.M_IN_KM / self.duration
         )
 
+    def get_spent_calories(
+            self,
+            mean_speed: float | None = None,
+            *,
+            COEF_1: float = COEF_1,
+            COEF_2: float = COEF_2
+    ) -> float:
+        """Получить количество затраченных калорий при плавании."""
+
+        if mean_speed is None:
+            mean_speed = self.get_mean_speed()
+        return (mean_speed + COEF_1) * COEF_2 * self.weight * self.duration
+
+
+_UNKNOWN_MSG = (
+    'Данный тип тренировки неизвестен. '
+    'Попробуйте походить, поплавать или бег.'
+)
+
+WORKOUT_CODE: dict[str, type[Training]] = {
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking,
+}
+
 
-def read_package(workout_type: str, data: list[int]) -> Training:
+def _training_message(training_class: type[Training], data: tuple) -> str:
+    """Получить сообщение о тренировке."""
+
+    return str(training_class(*data).show_training_info())
+
+
+# Ключ кэша — сам класс тренировки, поэтому замена класса в WORKOUT_CODE
+# сразу даёт новые сообщения. Изменение констант уже известного класса
+# кэш не замечает: после него вызовите _cached_training_message.cache_clear.
+_cached_training_message = lru_cache(maxsize=1024)(_training_message)
+
+
+def get_package_message(workout_type: str, data: list[int]) -> str:
+    """Получить сообщение по данным, полученным от датчиков."""
+
+    training_class = WORKOUT_CODE.get(workout_type)
+    if training_class is None:
+        # В отличие от homework.read_package, здесь не бросаем ValueError:
+        # main печатает отчёт по всем пакетам, и неизвестный тип тренировки
+        # попадает в отчёт отдельной строкой, не прерывая остальные.
+        return _UNKNOWN_MSG
+    data = tuple(data)
+    try:
+        hash(data)
+    except TypeError:
+        # Нехешируемые показатели считаем без кэша.
+        return _training_message(training_class, data)
+    return _cached_training_message(training_class, data)
+
+
+def read_package(workout_type: str, data: list[int]) -> None:
     """Прочитать данные полученные от датчиков."""
 
-    workout_code: dict[str, type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking,
-    }
-    if workout_type in workout_code:
-        training: Training = workout_code[workout_type](*data)
-        info: InfoMessage = training.show_training_info()
-        print(info)
-    else:
-        print(
-            'Данный тип тренировки неизвестен. '
-            'Попробуйте походить, поплавать или бег.'
-        )
+    print(get_package_message(workout_type, data))
 
 
 def main(packages: tuple) -> None:
-    return [read_package(*package) for package in packages]
+    sys.stdout.write(
+        ''.join(f'{get_package_message(*package)}\n' for package in packages)
+    )
 
 
 packages = [
@@ -1,7 +1,10 @@
 import re
+import sys
 import pytest
 import types
 import inspect
+import subprocess
+from pathlib import Path
 from collections import namedtuple
 from conftest import Capturing
 
@@ -45,6 +48,29 @@ def test_read_package_return(input_data, expected):
     )
 
 
+def test_read_package_returns_new_training():
+    first = homework.read_package('RUN', [15000, 1, 75])
+    first.weight = 100
+    second = homework.read_package('RUN', [15000, 1, 75])
+    assert second is not first
+    assert second.weight == 75
+
+
+def test_read_package_unknown_type():
+    with pytest.raises(ValueError):
+        homework.read_package('XXX', [1, 1, 1])
+
+
+def test_read_package_jit_unknown_type():
+    with pytest.raises(ValueError):
+        homework.read_package_jit('XXX', [1, 1, 1])
+
+
+def test_Training_to_jit_not_defined():
+    with pytest.raises(NotImplementedError):
+        homework.Training(1, 1, 1).to_jit()
+
+
 def test_InfoMessage():
     assert inspect.isclass(homework.InfoMessage), (
         '`InfoMessage` должен быть классом.'
@@ -210,7 +236,7 @@ def test_Training_show_training_info(monkeypatch):
         'Создайте метод `show_training_info` в классе `Training`.'
     )
 
-    def mock_get_spent_calories():
+    def mock_get_spent_calories(mean_speed=None):
         return 100
     monkeypatch.setattr(
         training,
@@ -224,6 +250,19 @@ def test_Training_show_training_info(monkeypatch):
     )
 
 
+def test_Training_values_follow_attributes():
+    training = homework.Training(9000, 1, 75)
+    training.action = 1000
+    assert training.get_distance() == 0.65
+    assert training.get_mean_speed() == 0.65
+
+
+def test_Training_zero_duration_fails_on_read():
+    training = homework.Training(100, 0, 70)
+    with pytest.raises(ZeroDivisionError):
+        training.get_mean_speed()
+
+
 def test_Swimming():
     assert hasattr(homework, 'Swimming'), 'Создайте класс `Swimming`'
     assert inspect.isclass(homework.Swimming), (
@@ -397,6 +436,54 @@ def test_Running_get_spent_calories(input_data, expected):
     )
 
 
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+])
+def test_read_package_jit(input_data):
+    training = homework.read_package(*input_data)
+    compiled = homework.read_package_jit(*input_data)
+    for method in ('get_distance', 'get_mean_speed', 'get_spent_calories'):
+        assert round(getattr(compiled, method)(), 3) == round(
+            getattr(training, method)(), 3
+        ), (
+            f'Метод `{method}` скомпилированного класса должен совпадать '
+            'с методом обычного класса тренировки.'
+        )
+
+
+def test_import_does_not_load_numpy_or_numba():
+    code = (
+        'import homework, sys; '
+        'print("numba" in sys.modules or "numpy" in sys.modules)'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=Path(homework.__file__).parent,
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == 'False', (
+        'Импорт `homework` не должен загружать numpy и numba.'
+    )
+
+
+def test_subclass_constants_are_used():
+    class FastRunning(homework.Running):
+        CALORIES_MEAN_SPEED_MULTIPLIER = 1000
+
+    running = homework.Running(15000, 1, 75)
+    fast = FastRunning(15000, 1, 75)
+    assert fast.get_spent_calories() > running.get_spent_calories(), (
+        'Константы подкласса должны влиять на расчёт калорий.'
+    )
+    assert round(fast.to_jit().get_spent_calories(), 3) == round(
+        fast.get_spent_calories(), 3
+    ), (
+        'Скомпилированная копия должна использовать константы подкласса.'
+    )
+
+
 def test_main():
     assert hasattr(homework, 'main'), (
         'Создайте главную функцию программы с именем `main`.'
@@ -451,3 +538,106 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def test_main_batch():
+    assert hasattr(homework, 'main_batch'), (
+        'Создайте функцию пакетной обработки `main_batch`.'
+    )
+    packages = [
+        ('RUN', [15000, 1, 75]),
+        ('RUN', [1206, 12, 6]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+        ('SWM', [720, 1, 80, 25, 40]),
+    ]
+    expected = [
+        'Тип тренировки: Running; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 9.750 км; '
+        'Ср. скорость: 9.750 км/ч; '
+        'Потрачено ккал: 797.805.',
+        'Тип тренировки: Running; '
+        'Длительность: 12.000 ч.; '
+        'Дистанция: 0.784 км; '
+        'Ср. скорость: 0.065 км/ч; '
+        'Потрачено ккал: 12.812.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 349.252.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 2.512 ч.; '
+        'Дистанция: 1.950 км; '
+        'Ср. скорость: 0.776 км/ч; '
+        'Потрачено ккал: 408.429.',
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+    ]
+    with Capturing() as batch_output:
+        homework.main_batch(
+            [data for code, data in packages if code == 'RUN'],
+            [data for code, data in packages if code == 'WLK'],
+            [data for code, data in packages if code == 'SWM'],
+        )
+    assert batch_output == expected, (
+        'Функция `main_batch` должна печатать сообщения '
+        'для каждой тренировки пакета.'
+    )
+
+
+@pytest.mark.parametrize('run_arr, walk_arr, swim_arr', [
+    ([[1, 1, 1, 1]] * 3, [], []),
+    ([], [[9000, 1, 75]], []),
+    ([], [], [[720, 1, 80, 25]]),
+])
+def test_main_batch_wrong_width(run_arr, walk_arr, swim_arr):
+    with pytest.raises(ValueError):
+        homework.main_batch(run_arr, walk_arr, swim_arr)
+
+
+@pytest.mark.parametrize('run_arr, walk_arr, swim_arr', [
+    ([[100, 0, 70]], [], []),
+    ([], [[9000, -1, 75, 180]], []),
+    ([], [], [[720, 0, 80, 25, 40]]),
+])
+def test_main_batch_non_positive_duration(run_arr, walk_arr, swim_arr):
+    with pytest.raises(ValueError):
+        homework.main_batch(run_arr, walk_arr, swim_arr)
+
+
+def test_subclass_training_type():
+    class Rowing(homework.Running):
+        pass
+
+    assert Rowing.TRAINING_TYPE == 'Rowing'
+    assert homework.Running.TRAINING_TYPE == 'Running'
+    assert homework.Training.TRAINING_TYPE == 'Training'
+
+
+@pytest.mark.parametrize('workout_class, input_data', [
+    ('Running', [15000, 1, 75]),
+    ('SportsWalking', [9000, 1, 75, 180]),
+    ('Swimming', [720, 1, 80, 25, 40]),
+])
+def test_show_training_info_computes_once(workout_class, input_data):
+    calls = {'get_distance': 0, 'get_mean_speed': 0}
+    base = getattr(homework, workout_class)
+
+    class Counting(base):
+        def get_distance(self):
+            calls['get_distance'] += 1
+            return super().get_distance()
+
+        def get_mean_speed(self):
+            calls['get_mean_speed'] += 1
+            return super().get_mean_speed()
+
+    info = Counting(*input_data).show_training_info()
+    assert calls['get_mean_speed'] == 1
+    assert calls['get_distance'] <= 2
+    assert info.calories == base(*input_data).get_spent_calories()
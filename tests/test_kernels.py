@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+import kernels
+
+
+def run_cal(speed, duration, weight):
+    return (18 * speed + 1.79) * weight / 1000 * (duration * 60)
+
+
+def walk_cal(speed, duration, weight, height):
+    return ((0.035 * weight
+             + ((speed * 0.278)**2 / (height / 100)) * 0.029 * weight)
+            * (duration * 60))
+
+
+def swim_cal(speed, duration, weight):
+    return (speed + 1.1) * 2 * weight * duration
+
+
+def random_trainings(count=2000):
+    rnd = random.Random(2022)
+    return [
+        (rnd.uniform(0.1, 20), rnd.uniform(0.1, 5),
+         rnd.uniform(40, 150), rnd.uniform(140, 210))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('kernel, formula, arity, constants', [
+    (kernels.run_cal, run_cal, 3, (18, 1.79, 60 / 1000)),
+    (kernels.walk_cal, walk_cal, 4, (0.035, 0.029, 0.278 ** 2 * 100, 60)),
+    (kernels.swim_cal, swim_cal, 3, (1.1, 2)),
+])
+def test_kernel_matches_python_formula(kernel, formula, arity, constants):
+    for row in random_trainings():
+        args = row[:arity]
+        result = kernel(*args, *constants)
+        assert result == kernel.py_func(*args, *constants), (
+            f'Скомпилированная `{kernel.__name__}` должна считать так же, '
+            'как её исходный код на Python.'
+        )
+        assert f'{result:.3f}' == f'{formula(*args):.3f}', (
+            f'Формула `{kernel.__name__}` расходится с исходной формулой '
+            'расчёта калорий.'
+        )
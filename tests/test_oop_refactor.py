@@ -0,0 +1,175 @@
+import inspect
+
+import pytest
+
+import oop_refactor
+
+
+def test_Training_is_abstract():
+    with pytest.raises(TypeError):
+        oop_refactor.Training(720, 1, 80)
+
+
+def test_Training_subclass_without_calories_is_abstract():
+    class Rowing(oop_refactor.Training):
+        pass
+
+    with pytest.raises(TypeError):
+        Rowing(720, 1, 80)
+
+
+class RecordingStdout:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return len(text)
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    (('SWM', [720, 1, 80, 25, 40]),
+     'Тип тренировки: Swimming; '
+     'Длительность: 1.000 ч.; '
+     'Дистанция: 0.994 км; '
+     'Ср. скорость: 1.000 км/ч; '
+     'Потрачено ккал: 336.000.'),
+    (('RUN', [15000, 1, 75]),
+     'Тип тренировки: Running; '
+     'Длительность: 1.000 ч.; '
+     'Дистанция: 9.750 км; '
+     'Ср. скорость: 9.750 км/ч; '
+     'Потрачено ккал: 797.805.'),
+    (('WLK', [9000, 1, 75, 180]),
+     'Тип тренировки: SportsWalking; '
+     'Длительность: 1.000 ч.; '
+     'Дистанция: 5.850 км; '
+     'Ср. скорость: 5.850 км/ч; '
+     'Потрачено ккал: 349.252.'),
+    (('XXX', [1, 1, 1]),
+     'Данный тип тренировки неизвестен. '
+     'Попробуйте походить, поплавать или бег.'),
+])
+def test_get_package_message(input_data, expected):
+    assert oop_refactor.get_package_message(*input_data) == expected
+
+
+def test_main_writes_once(monkeypatch):
+    stdout = RecordingStdout()
+    monkeypatch.setattr(oop_refactor.sys, 'stdout', stdout)
+    oop_refactor.main(oop_refactor.packages)
+    assert len(stdout.writes) == 1
+    assert stdout.writes[0] == ''.join(
+        oop_refactor.get_package_message(*package) + '\n'
+        for package in oop_refactor.packages
+    )
+
+
+def test_get_package_message_ignores_number_types():
+    assert oop_refactor.get_package_message('RUN', [15000, 1, 75]) == (
+        oop_refactor.get_package_message('RUN', [15000.0, 1.0, 75.0])
+    )
+
+
+def test_get_package_message_follows_workout_code(monkeypatch):
+    class Rowing(oop_refactor.Running):
+        pass
+
+    monkeypatch.setitem(oop_refactor.WORKOUT_CODE, 'RUN', Rowing)
+    assert oop_refactor.get_package_message('RUN', [15000, 1, 75]).startswith(
+        'Тип тренировки: Rowing;'
+    )
+
+
+def test_get_package_message_unhashable_data():
+    np = pytest.importorskip('numpy')
+    assert oop_refactor.get_package_message(
+        'RUN', [15000, 1, np.array(75.0)]
+    ) == oop_refactor.get_package_message('RUN', [15000, 1, 75])
+
+
+def test_InfoMessage_is_frozen():
+    message = oop_refactor.InfoMessage('Running', 1, 9.75, 9.75, 797.805)
+    with pytest.raises(AttributeError):
+        message.calories = 0
+
+
+def test_InfoMessage_caches_text():
+    message = oop_refactor.InfoMessage('Running', 1, 9.75, 9.75, 797.805)
+    expected = (
+        'Тип тренировки: Running; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 9.750 км; '
+        'Ср. скорость: 9.750 км/ч; '
+        'Потрачено ккал: 797.805.'
+    )
+    assert message._message == expected
+    assert str(message) is message._message
+    assert message == oop_refactor.InfoMessage(
+        'Running', 1, 9.75, 9.75, 797.805
+    )
+    assert '_message' not in repr(message)
+
+
+def test_subclass_constants_are_rebaked():
+    class FastRunning(oop_refactor.Running):
+        CALORIES_MEAN_SPEED_MULTIPLIER = 1000
+
+    running = oop_refactor.Running(15000, 1, 75)
+    fast = FastRunning(15000, 1, 75)
+    assert round(running.get_spent_calories(), 3) == 797.805
+    assert fast.get_spent_calories() > running.get_spent_calories()
+
+
+def test_explicit_get_spent_calories_is_kept():
+    class FixedRunning(oop_refactor.Running):
+        def get_spent_calories(self):
+            return 1.0
+
+    class FixedChild(FixedRunning):
+        pass
+
+    assert FixedChild(15000, 1, 75).get_spent_calories() == 1.0
+
+
+def test_inherited_get_spent_calories_has_source():
+    class FastRunning(oop_refactor.Running):
+        CALORIES_MEAN_SPEED_MULTIPLIER = 1000
+
+    method = FastRunning.get_spent_calories
+    assert method.__qualname__.endswith('FastRunning.get_spent_calories')
+    assert method.__kwdefaults__['CALORIES_MEAN_SPEED_MULTIPLIER'] == 1000
+    assert 'def get_spent_calories' in inspect.getsource(method)
+    assert 'get_spent_calories' in vars(oop_refactor.Running)
+
+
+def test_get_spent_calories_uses_get_mean_speed():
+    class FastSwimming(oop_refactor.Swimming):
+        def get_mean_speed(self):
+            return 100
+
+    swimming = FastSwimming(720, 1, 80, 25, 40)
+    assert swimming.get_spent_calories() == (100 + 1.1) * 2 * 80 * 1
+    assert 'Ср. скорость: 100.000 км/ч' in str(swimming.show_training_info())
+
+
+def test_Training_values_follow_attributes():
+    running = oop_refactor.Running(15000, 1, 75)
+    running.action = 1000
+    assert running.get_distance() == 0.65
+    assert running.get_mean_speed() == 0.65
+
+
+def test_Training_zero_duration_fails_on_read():
+    running = oop_refactor.Running(100, 0, 70)
+    with pytest.raises(ZeroDivisionError):
+        running.get_mean_speed()
+
+
+def test_subclass_training_type():
+    class Rowing(oop_refactor.Running):
+        pass
+
+    assert Rowing.TRAINING_TYPE == 'Rowing'
+    assert oop_refactor.Running.TRAINING_TYPE == 'Running'
+    assert oop_refactor.Training.TRAINING_TYPE == 'Training'